@@ -312,6 +312,24 @@ STATUSWORD_2_STATE: List[Tuple[int, int, State]] = [
 """
 
 
+_RELEVANT_STATUSWORD_BITS: int = 0b1101111
+"""Union of all state relevant statusword bit masks."""
+
+_STATUSWORD_2_STATE_LOOKUP: Dict[int, State] = {}
+"""Precompiled statusword (relevant bits only) -> state lookup table. Built
+once at import from :data:`STATUSWORD_2_STATE` so the per-cycle state decode is
+a single dict probe instead of a linear mask scan.
+
+:meta hide-value:
+"""
+
+for _word in range(_RELEVANT_STATUSWORD_BITS + 1):
+    for _mask, _value, _state in STATUSWORD_2_STATE:
+        if _word & _mask == _value:
+            _STATUSWORD_2_STATE_LOOKUP[_word] = _state
+            break
+
+
 def which_state(statusword: int) -> State:
     """Extract state from statusword number.
 
@@ -324,11 +342,11 @@ def which_state(statusword: int) -> State:
     Raises:
         ValueError: If no valid state was found.
     """
-    for mask, value, state in STATUSWORD_2_STATE:
-        if (statusword & mask) == value:
-            return state
+    state = _STATUSWORD_2_STATE_LOOKUP.get(statusword & _RELEVANT_STATUSWORD_BITS)
+    if state is None:
+        raise ValueError(f'Unknown state for statusword {statusword}!')
 
-    raise ValueError('Unknown state for statusword {statusword}!')
+    return state
 
 
 def supported_operation_modes(supportedDriveModes: int) -> Iterator[OperationMode]:
@@ -668,6 +686,14 @@ class CiA402Node(RemoteNode):
 
         network.register_rpdo(self.rpdo[2])
 
+        # Cache the hot cyclic position PDO variables once. node.pdo[...]
+        # searches through all PDO maps on every single access which adds up
+        # at the control loop rate.
+        self._targetPositionPdo = self.pdo[TARGET_POSITION]
+        self._actualPositionPdo = self.pdo[POSITION_ACTUAL_VALUE]
+        self._targetVelocityPdo = self.pdo[TARGET_VELOCITY]
+        self._actualVelocityPdo = self.pdo[VELOCITY_ACTUAL_VALUE]
+
     def setup_txpdo(self,
             nr: int,
             *variables: CanOpenRegister,
@@ -941,19 +967,19 @@ class CiA402Node(RemoteNode):
 
     def set_target_position(self, pos):
         """Set target position in device units."""
-        self.pdo[TARGET_POSITION].raw = pos
+        self._targetPositionPdo.raw = pos
 
     def get_actual_position(self):
         """Get actual position in device units."""
-        return self.pdo[POSITION_ACTUAL_VALUE].raw
+        return self._actualPositionPdo.raw
 
     def set_target_velocity(self, vel):
         """Set target velocity in device units."""
-        self.pdo[TARGET_VELOCITY].raw = vel
+        self._targetVelocityPdo.raw = vel
 
     def get_actual_velocity(self):
         """Get actual velocity in device units."""
-        return self.pdo[VELOCITY_ACTUAL_VALUE].raw
+        return self._actualVelocityPdo.raw
 
     def move_to(self,
             position: int,
@@ -87,6 +87,7 @@ def make_connection(output: OutputBase, input_: InputBase):
     # Make the actual connection
     output.outgoingConnections.add(input_)
     input_.incomingConnection = output
+    output._connections_changed()
 
 
 def break_connection(output: OutputBase, input_: InputBase):
@@ -101,6 +102,7 @@ def break_connection(output: OutputBase, input_: InputBase):
     # Break the actual connection
     output.outgoingConnections.remove(input_)
     input_.incomingConnection = None
+    output._connections_changed()
 
 
 def is_connected(output: OutputBase, input_: InputBase) -> bool:
@@ -189,6 +191,9 @@ class OutputBase:
         """Disconnect input."""
         break_connection(self, input_)
 
+    def _connections_changed(self):
+        """Hook. Outgoing connections have been rewired."""
+
     __str__ = str_function
 
 
@@ -351,7 +356,22 @@ class MessageOutput(OutputBase):
 
     """Message output. Sends messages to all connected message inputs."""
 
+    def __init__(self, owner: Optional[Block] = None):
+        super().__init__(owner)
+        self._receivers: tuple = ()
+        """Snapshot of the outgoing connections for :meth:`send`. Tuple
+        iteration is cheaper than a fresh set iterator per message. Gets
+        invalidated via :meth:`_connections_changed` on every (re)wiring.
+        """
+
+    def _connections_changed(self):
+        self._receivers = ()
+
     def send(self, message: Any):
         """Send message to all connected message inputs."""
-        for con in self.outgoingConnections:
+        receivers = self._receivers
+        if not receivers and self.outgoingConnections:
+            receivers = self._receivers = tuple(self.outgoingConnections)
+
+        for con in receivers:
             con.push(message)
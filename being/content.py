@@ -1,15 +1,16 @@
 """Content manager. Manages motions inside content directory."""
 import collections.abc
+import concurrent.futures
 import glob
 import os
 from collections import OrderedDict
-from typing import Callable, Iterator, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
 from being.configuration import CONFIG
 from being.curve import Curve
 from being.logging import get_logger
 from being.pubsub import PubSub
-from being.serialization import loads, dumps
+from being.serialization import loads, dumps, dumpb
 from being.spline import BPoly, split_spline
 from being.utils import SingleInstanceCache, read_file, rootname, write_file
 
@@ -38,23 +39,6 @@ def stripext(p: str) -> str:
     return root
 
 
-def removeprefix(string: str, prefix: str) -> str:
-    """Remove string prefix for Python < 3.9. If string does not start with
-    prefix leave as is.
-
-    Args:
-        string: Input string.
-        prefix: Prefix to remove.
-
-    Returns:
-        Trimmed string.
-    """
-    if string.startswith(prefix):
-        return string[len(prefix):]
-
-    return string
-
-
 def upgrade_splines_to_curves(directory, logger=None):
     """Go through each JSON file inside directory and upgrade every serialized
     spline to a curve.
@@ -85,14 +69,14 @@ class Files(collections.abc.MutableMapping):
     most recently modified.
     """
 
-    def __init__(self, directory: str, loads: Callable = loads, dumps: Callable = dumps):
+    def __init__(self, directory: str, loads: Callable = loads, dumps: Callable = dumpb):
         """
         Args:
             directory: Directory to manage.
             loads (optional): Serialization loader function. Default is
                 :func:`being.serialization.loads`.
-            dumps (optional): Serialization dumper function. Default is
-                :func:`being.serialization.dumps`.
+            dumps (optional): Serialization dumper function (str or bytes
+                output). Default is :func:`being.serialization.dumpb`.
         """
         self.directory: str = directory
         """Directory to manage."""
@@ -103,51 +87,136 @@ class Files(collections.abc.MutableMapping):
         self.dumps: Callable = dumps
         """Serialization dumper function."""
 
+        self._cache: Dict[str, tuple] = {}
+        """Parsed file cache. Path -> (st_mtime_ns, parsed object)."""
+
+        self._prefix: str = os.path.join(directory, '')
+        """Directory prefix with trailing separator. Precomputed once so the
+        hot path does not re-join / re-concatenate per access.
+        """
+
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        """Shared thread pool for :meth:`load_all`. Created lazily on the
+        first load which actually has to hit the disk.
+        """
+
         os.makedirs(self.directory, exist_ok=True)
 
     def _fullpath(self, path: str) -> str:
         """Resolve fullpath."""
-        return os.path.join(self.directory, path)
+        return self._prefix + path
 
-    def _remove_directory(self, filepath):
-        prefix = self.directory + '/'
-        return removeprefix(filepath, prefix)
+    def _scan(self) -> list:
+        """Scan directory in a single pass. Stat information of the yielded
+        :class:`os.DirEntry` objects is cached (no additional stat syscall per
+        file). Hidden files are skipped.
+        """
+        with os.scandir(self.directory) as entries:
+            return [
+                entry for entry in entries
+                if not entry.name.startswith('.')
+            ]
 
     def _recently_modified(self) -> Iterator[str]:
         """Most recently modified filenames."""
-        filepaths = glob.iglob(self.directory + '/*')
-        mostRecently = sorted(filepaths, key=os.path.getmtime, reverse=True)
-        return map(self._remove_directory, mostRecently)
+        entries = sorted(self._scan(), key=lambda entry: entry.stat().st_mtime, reverse=True)
+        return (entry.name for entry in entries)
 
     def _alphabetically(self) -> Iterator[str]:
         """Alphabetically ordered filenames."""
-        filepaths = glob.iglob(self.directory + '/*')
-        mostRecently = sorted(filepaths)
-        return map(self._remove_directory, mostRecently)
+        entries = sorted(self._scan(), key=lambda entry: entry.name)
+        return (entry.name for entry in entries)
 
-    def __getitem__(self, path: str) -> Iterator[str]:
+    def __getitem__(self, path: str) -> object:
         fp = self._fullpath(path)
-        return self.loads(read_file(fp))
+        mtime = os.stat(fp).st_mtime_ns
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        obj = self.loads(read_file(fp, binary=True))
+        self._cache[path] = (mtime, obj)
+        return obj
 
     def __setitem__(self, path: str, value: object):
         fp = self._fullpath(path)
         write_file(fp, self.dumps(value))
+        # Freshly written object is by definition up-to-date. Cache it so that
+        # the read-back following a save does not re-parse the file.
+        self._cache[path] = (os.stat(fp).st_mtime_ns, value)
 
     def __delitem__(self, path: str):
         fp = self._fullpath(path)
+        self._cache.pop(path, None)
         os.remove(fp)
 
     def __iter__(self):
         return iter(self._alphabetically())
 
     def __len__(self):
-        return len(self._alphabetically())
+        return len(self._scan())
 
     def __contains__(self, path: str):
         # Skip __iter__
         fp = self._fullpath(path)
         return os.path.exists(fp)
 
+    def rename(self, oldPath: str, newPath: str) -> None:
+        """Rename file inside directory. Atomic os.replace instead of a full
+        read / re-serialize / write round trip.
+
+        Args:
+            oldPath: Old file path.
+            newPath: New file path.
+
+        Raises:
+            KeyError: If old file does not exist.
+        """
+        try:
+            os.replace(self._fullpath(oldPath), self._fullpath(newPath))
+        except FileNotFoundError:
+            raise KeyError(oldPath)
+
+        # Renaming preserves mtime -> cache entry stays valid under new path
+        self._cache.pop(newPath, None)
+        cached = self._cache.pop(oldPath, None)
+        if cached is not None:
+            self._cache[newPath] = cached
+
+    def write_raw(self, path: str, data: bytes, obj: object):
+        """Write already serialized file content and cache the corresponding
+        parsed object. Skips the re-serialization when the caller got `data`
+        in serialized form in the first place (e.g. an API request body).
+
+        Args:
+            path: File path.
+            data: Serialized file content.
+            obj: Parsed object corresponding to `data`.
+        """
+        fp = self._fullpath(path)
+        write_file(fp, data)
+        self._cache[path] = (os.stat(fp).st_mtime_ns, obj)
+
+    def load_all(self) -> List[tuple]:
+        """Load all files concurrently. Reading and parsing the files is
+        dispatched to a shared thread pool which overlaps the per-file disk
+        latency (instead of one sequential read + parse per file). When every
+        file is already cached the thread pool is skipped altogether.
+
+        Returns:
+            (path, parsed object) tuples in alphabetical order.
+        """
+        paths = list(self._alphabetically())
+        if all(path in self._cache for path in paths):
+            # Warm cache -> only mtime checks left. Not worth the thread
+            # hand-off.
+            return [(path, self[path]) for path in paths]
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+        return list(zip(paths, self._executor.map(self.__getitem__, paths)))
+
     def __str__(self):
         return '%s(directory=%r)' % (type(self).__name__, self.directory)
 
@@ -210,14 +279,21 @@ class Content(PubSub, SingleInstanceCache):
         """
         return self.data[name + self.ext]
 
-    def save_curve(self, name: str, curve: BPoly):
+    def save_curve(self, name: str, curve: BPoly, raw: Optional[bytes] = None):
         """Save motion curve to disk.
 
         Args:
             name: Curve name.
             curve: Motion curve to save.
+            raw (optional): Already serialized representation of `curve`.
+                Saves the re-serialization when provided.
         """
-        self.data[name + self.ext] = curve
+        path = name + self.ext
+        if raw is not None and isinstance(self.data, Files):
+            self.data.write_raw(path, raw, curve)
+        else:
+            self.data[path] = curve
+
         self.publish(CONTENT_CHANGED)
 
     def delete_curve(self, name: str):
@@ -238,7 +314,11 @@ class Content(PubSub, SingleInstanceCache):
         """
         oldPath = oldName + self.ext
         newPath = newName + self.ext
-        self.data[newPath] = self.data.pop(oldPath)
+        if isinstance(self.data, Files):
+            self.data.rename(oldPath, newPath)
+        else:
+            self.data[newPath] = self.data.pop(oldPath)
+
         self.publish(CONTENT_CHANGED)
 
     def find_free_name(self, wishName='Untitled'):
@@ -268,15 +348,30 @@ class Content(PubSub, SingleInstanceCache):
         """List current curve names."""
         return list(map(stripext, self.data))
 
+    def _loaded_curves(self) -> Iterator[tuple]:
+        """Iterate over all loaded (path, curve) tuples. Uses batched
+        concurrent loading when possible.
+        """
+        if isinstance(self.data, Files):
+            return iter(self.data.load_all())
+
+        return iter(self.data.items())
+
+    def iter_curves(self) -> Iterator[tuple]:
+        """Iterate over all (name, curve) tuples in alphabetical order.
+
+        Yields:
+            (name, curve) tuples.
+        """
+        for path, curve in self._loaded_curves():
+            yield stripext(path), curve
+
     def forge_message(self) -> OrderedDict:
         """Forge content / motions message."""
         # TODO: Rename type motions -> curves ???
         return OrderedDict([
             ('type', 'motions'),
-            ('curves', [
-                (stripext(path), motion)
-                for path, motion in self.data.items()
-            ]),
+            ('curves', list(self.iter_curves())),
         ])
 
     def __str__(self):
@@ -1,6 +1,6 @@
 """Optimal trajectory and kinematic filtering."""
 import functools
-from typing import NamedTuple
+from typing import Callable, NamedTuple
 
 import numpy as np
 
@@ -168,6 +168,54 @@ def kinematic_filter(
     return initial._replace(acceleration=0.)
 
 
+def make_kinematic_filter(
+        dt: float,
+        targetVelocity: float = 0.0,
+        maxSpeed: float = 1.0,
+        maxAcc: float = 1.0,
+        lower: float = -INF,
+        upper: float = INF,
+    ) -> Callable[[float, State], State]:
+    """Specialize :func:`kinematic_filter` for fixed filter parameters.
+
+    All constant arguments get baked into a closure so that the per-tick call
+    takes only (targetPosition, state), without a kwargs dict and without
+    re-validating the clipping bounds each time.
+
+    Args:
+        dt: Time interval.
+        targetVelocity: Target velocity value.
+        maxSpeed: Maximum speed value.
+        maxAcc: Maximum acceleration (and deceleration) value.
+        lower: Lower clipping value for target value.
+        upper: Upper clipping value for target value.
+
+    Returns:
+        Specialized filter function (targetPosition, state) -> next state.
+    """
+    if lower > upper:
+        lower, upper = upper, lower
+
+    def filter_step(targetPosition: float, state: State) -> State:
+        if targetPosition < lower:
+            targetPosition = lower
+        elif targetPosition > upper:
+            targetPosition = upper
+
+        target = (targetPosition, targetVelocity)
+        remaining = dt
+        for duration, acc in optimal_trajectory(state, target, maxSpeed, maxAcc):
+            if remaining <= duration:
+                return step((state.position, state.velocity, acc), remaining)
+
+            state = step((state.position, state.velocity, acc), duration)
+            remaining -= duration
+
+        return state._replace(acceleration=0.)
+
+    return filter_step
+
+
 def kinematic_filter_vec(targets, dt, initial=State(), **kwargs):
     traj = []
     for target in targets:
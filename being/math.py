@@ -24,12 +24,18 @@ def clip(number: float, lower: float, upper: float) -> float:
         lower: Lower bound.
         upper: Upper bound.
 
+    Also accepts arrays so that callers can clip whole sample buffers in one
+    vectorized call.
+
     Returns:
         Clipped value.
     """
     if lower > upper:
         lower, upper = upper, lower
 
+    if isinstance(number, ndarray):
+        return np.clip(number, lower, upper)
+
     return max(lower, min(number, upper))
 
 
@@ -40,13 +46,20 @@ def sign(number: float) -> float:
         number: Input value.
 
     Returns:
-        Sign part of the number.
+        Sign part of the number. For scalars branchless integer valued
+        (``sign(0) == 1``, like :func:`math.copysign` before).
+
+    Also accepts arrays (with :func:`numpy.sign` semantics, i.e. sign of zero
+    is zero).
 
     Example:
         >>> sign(-12.34)
-        -1.0
+        -1
     """
-    return math.copysign(1., number)
+    if isinstance(number, ndarray):
+        return np.sign(number)
+
+    return (number >= 0.) - (number < 0.)
 
 
 def solve_quadratic_equation(a: float, b: float, c: float) -> Tuple[float, float]:
@@ -64,6 +77,33 @@ def solve_quadratic_equation(a: float, b: float, c: float) -> Tuple[float, float
     return x0, x1
 
 
+def solve_quadratic_equation_vec(a, b, c) -> Tuple[ndarray, ndarray]:
+    """Batched version of :func:`solve_quadratic_equation` for arrays of
+    coefficients. Uses the numerically stable formulation
+
+    .. math::
+        q = -\\frac{1}{2} \\left( b + \\mathrm{sgn}(b) \\sqrt{b^2 - 4ac} \\right),
+        \\quad x_0 = \\frac{q}{a}, \\quad x_1 = \\frac{c}{q}
+
+    which avoids catastrophic cancellation for :math:`b^2 \\gg 4ac`. Note that
+    the roots are therefore not in the same order as with the scalar version.
+
+    Args:
+        a: Quadratic coefficients.
+        b: Linear coefficients.
+        c: Constant coefficients.
+
+    Returns:
+        tuple: Both solution arrays.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    c = np.asarray(c, dtype=float)
+    discriminant = np.sqrt(b * b - 4 * a * c)
+    q = -.5 * (b + np.copysign(discriminant, b))
+    return q / a, c / q
+
+
 def linear_mapping(xRange: Tuple[float, float], yRange: Tuple[float, float]) -> ndarray:
     """Get linear coefficients for
 
@@ -79,10 +119,10 @@ def linear_mapping(xRange: Tuple[float, float], yRange: Tuple[float, float]) ->
     """
     xmin, xmax = xRange
     ymin, ymax = yRange
-    return np.linalg.solve([
-        [xmin, 1.],
-        [xmax, 1.],
-    ], [ymin, ymax])
+    # Closed-form solution of the 2x2 system [[xmin, 1], [xmax, 1]]. No need
+    # for a general LAPACK solver here.
+    a = (ymax - ymin) / (xmax - xmin)
+    return np.array([a, ymin - a * xmin])
 
 
 class ArchimedeanSpiral(NamedTuple):
@@ -108,11 +148,14 @@ class ArchimedeanSpiral(NamedTuple):
 
     @staticmethod
     def arc_length_helper(anlge: float, b: float) -> float:
-        """Helper function for arc length calculations."""
-        return b / 2 * (
-            anlge * math.sqrt(1 + anlge ** 2)
-            + math.log(anlge + math.sqrt(1 + anlge ** 2))
-        )
+        """Helper function for arc length calculations. Also accepts angle
+        arrays for vectorized sweeps.
+        """
+        if isinstance(anlge, ndarray):
+            return b / 2 * (anlge * np.sqrt(1 + anlge ** 2) + np.arcsinh(anlge))
+
+        root = math.sqrt(1 + anlge ** 2)
+        return b / 2 * (anlge * root + math.asinh(anlge))
 
     def _arc_length(self, angle: float) -> float:
         return self.arc_length_helper(angle, self.b) + self.a * angle
@@ -143,13 +186,21 @@ class ArchimedeanSpiral(NamedTuple):
             # Trivial circle case
             return ArchimedeanSpiral(a, b=0.0), phi0
 
-        def func(x):
-            b, phi = x
-            return [
-                a + b * phi - .5 * outerDiameter,
-                cls.arc_length_helper(phi, b) + a * phi - arcLength,
-            ]
+        # The outer radius condition a + b * phi = R lets us eliminate
+        # b = (R - a) / phi. This reduces the former two equation fsolve system
+        # to a single scalar equation in phi which Newton solves with an
+        # analytic derivative (no MINPACK setup, no finite difference
+        # Jacobian).
+        R = .5 * outerDiameter
+
+        def func(phi):
+            return cls.arc_length_helper(phi, (R - a) / phi) + a * phi - arcLength
+
+        def fprime(phi):
+            root = math.sqrt(1 + phi ** 2)
+            g = phi * root + math.asinh(phi)
+            return .5 * (R - a) * (2 * phi * root - g) / phi ** 2 + a
 
-        x0 = [0.0, phi0]
-        bEst, phiEst = scipy.optimize.fsolve(func, x0)
+        phiEst = scipy.optimize.newton(func, phi0, fprime=fprime)
+        bEst = (R - a) / phiEst
         return cls(a, b=bEst), phiEst
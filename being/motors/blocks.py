@@ -34,6 +34,7 @@ Available motor blocks are:
 
 """
 import abc
+import functools
 import itertools
 from typing import Optional, Dict, Any, Union
 
@@ -45,7 +46,7 @@ from being.can import load_object_dictionary
 from being.can.cia_402 import CiA402Node, OperationMode
 from being.configuration import CONFIG
 from being.constants import TAU
-from being.kinematics import kinematic_filter, State as KinematicState
+from being.kinematics import make_kinematic_filter, State as KinematicState
 from being.logging import get_logger
 from being.math import ArchimedeanSpiral
 from being.motors.controllers import Controller, Mclm3002, Epos4
@@ -153,6 +154,16 @@ class DummyMotor(MotorBlock):
         self._enabled = False
         self.homing = DummyHoming()
 
+        # Specialized kinematic filter. All arguments except target and state
+        # are fixed for the lifetime of the block.
+        self._filter = make_kinematic_filter(
+            dt=INTERVAL,
+            maxSpeed=1.,
+            maxAcc=1.,
+            lower=0.,
+            upper=length,
+        )
+
     def enable(self, publish: bool = True):
         self._enabled = True
         super().enable(publish)
@@ -184,24 +195,17 @@ class DummyMotor(MotorBlock):
         Args:
             target: Target position.
         """
-        self.state = kinematic_filter(
-            target,
-            dt=INTERVAL,
-            initial=self.state,
-            maxSpeed=1.,
-            maxAcc=1.,
-            lower=0.,
-            upper=self.length,
-        )
+        self.state = self._filter(target, self.state)
 
     def update(self):
-        if self.homing.ongoing:
-            self.homing.update()
-            if not self.homing.ongoing:
+        homing = self.homing
+        if homing.ongoing:
+            homing.update()
+            if not homing.ongoing:
                 self.publish(MotorEvent.STATE_CHANGED)
 
-        elif self.homing.state is HomingState.HOMED:
-            self.step(target=self.input.value)
+        elif homing.state is HomingState.HOMED:
+            self.state = self._filter(self.input.value, self.state)
 
         self.output.value = self.state.position
 
@@ -345,9 +349,11 @@ class CanMotor(MotorBlock):
         for msg in self.controller.error_history_messages():
             self.publish(MotorEvent.ERROR, msg)
 
-        self.controller.subscribe(MotorEvent.STATE_CHANGED, lambda: self.publish(MotorEvent.STATE_CHANGED))
-        self.controller.subscribe(MotorEvent.ERROR, lambda msg: self.publish(MotorEvent.ERROR, msg))
-        self.controller.subscribe(MotorEvent.HOMING_CHANGED, lambda: self.publish(MotorEvent.STATE_CHANGED))
+        # functools.partial instead of lambdas: C-level dispatch without a
+        # fresh closure cell per motor.
+        self.controller.subscribe(MotorEvent.STATE_CHANGED, functools.partial(self.publish, MotorEvent.STATE_CHANGED))
+        self.controller.subscribe(MotorEvent.ERROR, functools.partial(self.publish, MotorEvent.ERROR))
+        self.controller.subscribe(MotorEvent.HOMING_CHANGED, functools.partial(self.publish, MotorEvent.STATE_CHANGED))
 
     def enable(self, publish: bool = False):
         self.controller.enable()
@@ -373,8 +379,8 @@ class CanMotor(MotorBlock):
         for profile in self.positionProfile.receive():
             self.controller.play_position_profile(profile)
 
-        self.controller.set_target_position(self.multiplier * self.targetPosition.value)
-        self.output.value = self.controller.get_actual_position() / self.multiplier
+        actual = self.controller.step(self.multiplier * self.targetPosition.value)
+        self.output.value = actual / self.multiplier
 
     def to_dict(self):
         dct = super().to_dict()
@@ -488,7 +494,7 @@ class WindupMotor(CanMotor):
 
         # xp, yp for linear position <-> angle target position interpolation
         self.angles = np.linspace(0, phiEst, 100)
-        self.positions = np.array([spiral.arc_length(phi) for phi in self.angles])
+        self.positions = spiral.arc_length(self.angles)
 
     def update(self):
         self.controller.update()
@@ -498,8 +504,7 @@ class WindupMotor(CanMotor):
             self.controller.play_position_profile(adjustedProfile)
 
         pos = np.interp(self.targetPosition.value, self.positions, self.angles)
-        self.controller.set_target_position(pos)
-        actual = np.interp(self.controller.get_actual_position(), self.angles, self.positions)
+        actual = np.interp(self.controller.step(pos), self.angles, self.positions)
         self.output.value = actual
 
     def to_dict(self):
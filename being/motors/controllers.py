@@ -49,6 +49,12 @@ __all__ = [ 'Controller', 'Mclm3002', 'Epos4', ]
 INTERVAL = CONFIG['General']['INTERVAL']
 LOGGER = get_logger(name=__name__, parent=None)
 
+# Pre-resolved enum members for the cyclic update code. Module-level bindings
+# skip the EnumMeta member lookup per tick.
+_STATE_CHANGED = MotorEvent.STATE_CHANGED
+_HOMING_CHANGED = MotorEvent.HOMING_CHANGED
+_ERROR = MotorEvent.ERROR
+
 
 def nested_get(dct: dict, keys: Iterable) -> Any:
     """Nested dict value access.
@@ -322,6 +328,19 @@ class Controller(MotorInterface):
         """Get actual position in SI units."""
         return self.node.get_actual_position() / self.position_si_2_device
 
+    def step(self, targetPosition: float) -> float:
+        """Fused set target / get actual position call for the cyclic update.
+        Single method dispatch per cycle instead of two.
+
+        Args:
+            targetPosition: Target position in SI units.
+
+        Returns:
+            Actual position in SI units.
+        """
+        self.set_target_position(targetPosition)
+        return self.get_actual_position()
+
     def play_position_profile(self, profile: PositionProfile):
         """Play a position profile :class:`PositionProfile`."""
         pos = int(self.position_si_2_device * profile.position)
@@ -361,7 +380,7 @@ class Controller(MotorInterface):
         for emcy in self.node.emcy.active:
             msg = self.format_emcy(emcy)
             self.logger.error(msg)
-            self.publish(MotorEvent.ERROR, msg)
+            self.publish(_ERROR, msg)
 
         self.node.emcy.reset()
 
@@ -374,7 +393,7 @@ class Controller(MotorInterface):
         """
         state = self.node.get_state('pdo')
         if self.state_changed(state):
-            self.publish(MotorEvent.STATE_CHANGED)
+            self.publish(_STATE_CHANGED)
 
         if state is State.FAULT:
             self.publish_errors()
@@ -383,7 +402,7 @@ class Controller(MotorInterface):
             self.homing.update()
             if not self.homing.ongoing:
                 self.restore()
-                self.publish(MotorEvent.HOMING_CHANGED)
+                self.publish(_HOMING_CHANGED)
 
         elif self.switchJob:
             try:
@@ -583,7 +602,7 @@ class Epos4(Controller):
 
             msg = self.format_emcy(emcy)
             self.logger.error(msg)
-            self.publish(MotorEvent.ERROR, msg)
+            self.publish(_ERROR, msg)
 
         self.node.emcy.reset()
 
@@ -30,19 +30,31 @@ import json
 import logging
 from collections import OrderedDict
 from enum import EnumMeta
-from typing import Generator, Dict, Any
+from typing import Generator, Dict, Any, Union
 
 import numpy as np
 from numpy import ndarray
 from scipy.interpolate import PPoly, BPoly, CubicSpline
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    ORJSON_OPTIONS = 0
+else:
+    # Numpy scalars (e.g. np.float64 start times) serialize in one native
+    # pass. Full ndarrays still go through the type-tagged dict representation
+    # in being_object_dump for wire format compatibility. Non-str dict keys
+    # (e.g. int block ids) get coerced like the stdlib encoder does.
+    ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 from being.block import Block
 from being.constants import EOT
 from being.curve import Curve
 from being.typing import Spline
 
 
-__all__ = [ 'FlyByDecoder', 'dumps', 'loads', 'register_enum', 'register_named_tuple', ]
+__all__ = [ 'FlyByDecoder', 'dumpb', 'dumps', 'loads', 'register_enum', 'register_named_tuple', ]
 
 
 NAMED_TUPLE_LOOKUP: Dict[str, type] = {}
@@ -331,6 +343,65 @@ class BeingEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
 
 
+def being_object_dump(obj: Any) -> Any:
+    """Recursively convert being object to plain JSON serializable primitives.
+
+    Same conversions as :class:`being.serialization.BeingEncoder` but applied
+    up-front so that a fast JSON backend (orjson) can take over the actual
+    encoding of the resulting dicts / lists / floats.
+
+    Args:
+        obj: Object to convert.
+
+    Returns:
+        JSON serializable representation of `obj`.
+    """
+    objType = type(obj)
+    if objType in NAMED_TUPLE_LOOKUP.values():
+        return being_object_dump(named_tuple_as_dict(obj))
+
+    if isinstance(obj, dict):
+        return {key: being_object_dump(value) for key, value in obj.items()}
+
+    if isinstance(obj, (list, tuple)):
+        return [being_object_dump(value) for value in obj]
+
+    if isinstance(obj, tuple(SPLINE_TYPES)):
+        return being_object_dump(spline_to_dict(obj))
+
+    if isinstance(obj, ndarray):
+        if obj.ndim == 0:  # Scalar shape
+            return float(obj)
+
+        return being_object_dump(ndarray_to_dict(obj))
+
+    if objType in ENUM_LOOKUP.values():
+        return being_object_dump(enum_to_dict(obj))
+
+    if objType is set:
+        return {'type': set.__name__, 'values': list(obj)}
+
+    if isinstance(obj, Block):
+        return being_object_dump(obj.to_dict())
+
+    if isinstance(obj, Curve):
+        return OrderedDict([
+            ('type', type(obj).__name__),
+            ('splines', being_object_dump(obj.splines)),
+        ])
+
+    if isinstance(obj, logging.LogRecord):
+        return {
+            'type': 'LogRecord',
+            'name': obj.name,
+            'message': obj.msg % obj.args,
+            'levelname': obj.levelname,
+            'levelno': obj.levelno,
+        }
+
+    return obj
+
+
 def dumps(obj: Any, *args, **kwargs) -> str:
     """Serialize being object to JSON string.
 
@@ -348,6 +419,9 @@ def dumps(obj: Any, *args, **kwargs) -> str:
         ... dumps(block)
         '{"type": "Block", "blockType": "Block", "name": "My Block", "id": 0, "inputNeighbors": [], "outputNeighbors": []}'
     """
+    if orjson is not None and not args and not kwargs:
+        return orjson.dumps(being_object_dump(obj), option=ORJSON_OPTIONS).decode()
+
     if 'indent' not in kwargs:
         kwargs['indent'] = 4
     if 'sort_keys' not in kwargs:
@@ -355,15 +429,50 @@ def dumps(obj: Any, *args, **kwargs) -> str:
     return json.dumps(obj, cls=BeingEncoder, *args, **kwargs)
 
 
-def loads(string: str) -> Any:
+def dumpb(obj: Any) -> bytes:
+    """Serialize being object to JSON bytes. Like :func:`dumps` but skips the
+    intermediate text string round trip when the orjson backend is active.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(being_object_dump(obj), option=ORJSON_OPTIONS)
+
+    return dumps(obj).encode()
+
+
+def _apply_object_hook(obj: Any) -> Any:
+    """Recursively apply :func:`being_object_hook` to an already parsed JSON
+    object tree (bottom-up, mirroring the stdlib ``object_hook`` traversal).
+    """
+    if isinstance(obj, list):
+        return [_apply_object_hook(value) for value in obj]
+
+    if isinstance(obj, dict):
+        return being_object_hook({
+            key: _apply_object_hook(value)
+            for key, value in obj.items()
+        })
+
+    return obj
+
+
+def loads(string: Union[str, bytes]) -> Any:
     """Deserialize being object from JSON string.
 
     Args:
-        string: Input string.
+        string: Input JSON string (or bytes).
 
     Returns:
         Decoded being object.
     """
+    if orjson is not None:
+        return _apply_object_hook(orjson.loads(string))
+
     return json.loads(string, object_hook=being_object_hook)
 
 
@@ -177,6 +177,34 @@ def spline_coefficients(spline: Spline, segment: int) -> ndarray:
     raise ValueError(f'segment number {segment} not in [0, {nSegments})!')
 
 
+def power_basis_segments(spline: Spline) -> List[list]:
+    r"""Decompose spline into per-interval power basis segments. Each segment
+    is a ``[start, end, coefficients]`` list where the coefficients are in
+    ascending power order relative to the segment start
+
+    .. math::
+        f(t) = \sum_j c_j \cdot (t - t_\mathrm{start})^j
+
+    so that a client can evaluate the spline with a single Horner pass per
+    query instead of recomputing the Bernstein basis functions.
+
+    Args:
+        spline: Input spline.
+
+    Returns:
+        Power basis segments.
+    """
+    if isinstance(spline, BPoly):
+        spline = PPoly.from_bernstein_basis(spline)
+
+    knots = spline.x
+    coeffs = spline.c
+    return [
+        [float(knots[seg]), float(knots[seg + 1]), coeffs[::-1, seg].tolist()]
+        for seg in range(coeffs.shape[1])
+    ]
+
+
 def split_spline(spline: Spline) -> List[Spline]:
     """Split multi dimensional spline along each dimension.
 
@@ -1,8 +1,10 @@
 """Miscellaneous helpers."""
 import collections
 import fnmatch
+import functools
 import glob
 import itertools
+import operator
 import os
 import random
 import weakref
@@ -79,16 +81,30 @@ def listdir(directory, fullpath=True) -> List[str]:
     ]
 
 
-def read_file(filepath: str) -> str:
-    """Read entire data from file."""
-    with open(filepath) as file:
+def read_file(filepath: str, binary: bool = False) -> str:
+    """Read entire data from file.
+
+    Args:
+        filepath: File to read.
+        binary (optional): Return raw bytes instead of text (skips the UTF-8
+            decode).
+    """
+    with open(filepath, 'rb' if binary else 'r') as file:
         return file.read()
 
 
 def write_file(filepath: str, data):
-    """Write data to file."""
-    with open(filepath, 'w') as file:
+    """Write data to file. Atomic write-then-rename with fsync so that a crash
+    mid-flight can not leave a partially written file behind.
+    """
+    tmp = filepath + '.tmp'
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    with open(tmp, mode) as file:
         file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(tmp, filepath)
 
 
 def update_dict_recursively(dct: dict, other: dict, default_factory: type = None) -> dict:
@@ -288,11 +304,9 @@ class NestedDict(collections.abc.MutableMapping):
         return d
 
     def __delitem__(self, key):
-        d = self.data
         *path, last = self._as_keys(key)
-        for k in path:
-            d = d[k]
-
+        # C-level traversal instead of a Python loop per key
+        d = functools.reduce(operator.getitem, path, self.data)
         del d[last]
 
     def __iter__(self):
@@ -305,14 +319,10 @@ class NestedDict(collections.abc.MutableMapping):
         return f'{type(self).__name__}({self.data!r})'
 
     def get(self, key, default=None):
-        d = self.data
-        for k in self._as_keys(key):
-            if k not in d:
-                return default
-
-            d = d[k]
-
-        return d
+        try:
+            return functools.reduce(operator.getitem, self._as_keys(key), self.data)
+        except (KeyError, IndexError, TypeError):
+            return default
 
     def setdefault(self, key, default=None):
         d = self.data
@@ -14,18 +14,20 @@ import numpy as np
 from aiohttp import web
 from aiohttp.typedefs import MultiDictProxy
 
-from being.behavior import State as BehaviorState, Behavior
+from being.behavior import BEHAVIOR_CHANGED, State as BehaviorState, Behavior
 from being.being import Being
 from being.configs import Config
 from being.configuration import CONFIG
 from being.connectables import ValueOutput, _ValueContainer
-from being.content import CONTENT_CHANGED, Content
+from being.constants import TWO_D
+from being.content import CONTENT_CHANGED, Content, stripext
 from being.curve import Curve
 from being.logging import get_logger
 from being.motors.blocks import MotorBlock
+from being.motors.definitions import MotorEvent
 from being.params import Parameter
-from being.serialization import loads, dumps
-from being.spline import fit_spline
+from being.serialization import loads, dumps, dumpb
+from being.spline import fit_spline, power_basis_segments
 from being.typing import Spline
 from being.utils import filter_by_type, update_dict_recursively
 from being.web.responses import respond_ok, json_response
@@ -33,6 +35,10 @@ from being.web.responses import respond_ok, json_response
 
 LOGGER = get_logger(name=__name__, parent=None)
 
+BEHAVIOR_STATES_BODY: bytes = dumpb(list(BehaviorState.__members__))
+"""Pre-serialized behavior state names. The enum is fixed at runtime so the
+payload can be encoded once at import time."""
+
 
 def messageify(obj) -> collections.OrderedDict:
     """Serialize being objects and wrap them inside a message object.
@@ -78,61 +84,94 @@ def content_routes(content: Content) -> web.RouteTableDef:
     """
     routes = web.RouteTableDef()
 
+    def require_curve(handler):
+        """Decorator resolving the curve name from the route and bailing out
+        with 404 before entering the handler when it does not exist.
+        """
+        @functools.wraps(handler)
+        async def wrapper(request):
+            name = request.match_info['name']
+            if not content.curve_exists(name):
+                return web.HTTPNotFound(text=f'Curve {name!r} does not exist!')
+
+            return await handler(request, name)
+
+        return wrapper
+
     @routes.get('/curves')
     async def get_curves(request):
-        """Get all current curves."""
-        return json_response(content.forge_message())
+        """Get all current curves. Streamed out one curve at a time so that
+        the whole listing never has to be buffered in memory at once.
+        """
+        response = web.StreamResponse()
+        response.content_type = 'application/json'
+        await response.prepare(request)
+        await response.write(b'{"type": "motions", "curves": [')
+        separator = b''
+        for name, curve in content.iter_curves():
+            chunk = dumpb([name, curve])
+            await response.write(separator + chunk)
+            separator = b', '
+
+        await response.write(b']}')
+        await response.write_eof()
+        return response
 
     @routes.get('/curves/{name}')
-    async def get_curve(request):
+    @require_curve
+    async def get_curve(request, name):
         """Get single curve by name."""
-        name = request.match_info['name']
-        if not content.curve_exists(name):
-            return web.HTTPNotFound(text=f'Curve {name!r} does not exist!')
-
         spline = content.load_curve(name)
         return json_response(spline)
 
+    @routes.get('/curves/{name}/power-basis')
+    @require_curve
+    async def get_curve_power_basis(request, name):
+        """Power basis segment decomposition of a curve. Cheap per-segment
+        Horner evaluation on the client side.
+        """
+        curve = content.load_curve(name)
+        return json_response([
+            power_basis_segments(spline)
+            for spline in curve.splines
+        ])
+
     @routes.post('/curves/{name}')
     async def create_curve(request):
         """Create a new curve."""
         name = request.match_info['name']
         try:
-            spline = await request.json(loads=loads)
+            raw = await request.read()
+            spline = loads(raw)
         except json.JSONDecodeError:
             return web.HTTPNotAcceptable(text='Failed deserializing JSON curve!')
 
-        content.save_curve(name, spline)
+        content.save_curve(name, spline, raw=raw)
         return json_response()
 
     @routes.put('/curves/{name}')
-    async def update_curve(request):
+    @require_curve
+    async def update_curve(request, name):
         """Update a existing curve."""
-        name = request.match_info['name']
-        if not content.curve_exists(name):
-            return web.HTTPNotFound(text=f'Motion {name!r} does not exist!')
-
         try:
-            spline = await request.json(loads=loads)
+            raw = await request.read()
+            spline = loads(raw)
         except json.JSONDecodeError:
             return web.HTTPNotAcceptable(text='Failed deserializing JSON curve!')
 
-        content.save_curve(name, spline)
+        content.save_curve(name, spline, raw=raw)
         return json_response()
 
     @routes.delete('/curves/{name}')
-    async def delete_curve(request):
+    @require_curve
+    async def delete_curve(request, name):
         """Delete a curve."""
-        name = request.match_info['name']
-        if not content.curve_exists(name):
-            return web.HTTPNotFound(text=f'Curve {name!r} does not exist!')
-
         content.delete_curve(name)
         return json_response()
 
     @routes.put('/rename_curve')
     async def rename_curve(request):
-        instructions = await request.json()
+        instructions = json.loads(await request.read())
         oldName = instructions['oldName']
         newName = instructions['newName']
         content.rename_curve(oldName, newName)
@@ -210,6 +249,7 @@ def content_routes(content: Content) -> web.RouteTableDef:
 
                 notificationMessages.append({'type': 'success', 'message': 'Uploaded file %r' % fp})
             except Exception as err:
+                LOGGER.exception('Failed uploading curve %r', fp)
                 notificationMessages.append({'type': 'error', 'message': '%r %s' % (fp, err)})
 
         content.publish(CONTENT_CHANGED)
@@ -235,6 +275,10 @@ def serialize_elk_graph(being: Being, skipParamBlocks: bool = True):
         double edges. These things do not matter for the execOrder, but they do
         for the block diagram.
     """
+    # id -> index maps instead of repeated list.index() linear scans per output
+    valueOutputIndices = {id(out): i for i, out in enumerate(being.valueOutputs)}
+    messageOutputIndices = {id(out): i for i, out in enumerate(being.messageOutputs)}
+
     # ELK style graph object
     elkGraph = collections.OrderedDict([
         ('id', 'root'),
@@ -261,10 +305,10 @@ def serialize_elk_graph(being: Being, skipParamBlocks: bool = True):
         for output in block.outputs:
             if isinstance(output, _ValueContainer):
                 connectionType = 'value'
-                index = being.valueOutputs.index(output)
+                index = valueOutputIndices[id(output)]
             else:
                 connectionType = 'message'
-                index = being.messageOutputs.index(output)
+                index = messageOutputIndices[id(output)]
 
             for input_ in output.outgoingConnections:
                 if input_.owner and input_.owner is not block:
@@ -292,6 +336,17 @@ def being_routes(being: Being) -> web.RouteTableDef:
 
     blockLookup = { block.id: block for block in being.execOrder }
 
+    # Pre-resolved per block. Replaces the former valueOutputs.index() linear
+    # scans per request (the block network is fixed after startup).
+    valueOutputIndices = {id(out): i for i, out in enumerate(being.valueOutputs)}
+    valueOutputIndicesLookup = {
+        block.id: [
+            valueOutputIndices[id(out)]
+            for out in filter_by_type(block.outputs, ValueOutput)
+        ]
+        for block in being.execOrder
+    }
+
     @routes.get('/blocks')
     async def get_blocks(request):
         return json_response(blockLookup)
@@ -311,22 +366,22 @@ def being_routes(being: Being) -> web.RouteTableDef:
     async def get_index_of_value_outputs(request):
         id = int(request.match_info['id'])
         try:
-            block = blockLookup[id]
-            return json_response([
-                being.valueOutputs.index(out)
-                for out in filter_by_type(block.outputs, ValueOutput)
-            ])
+            return json_response(valueOutputIndicesLookup[id])
         except KeyError:
             return web.HTTPBadRequest(text=f'Unknown block with id {id}!')
 
+    # Block network and configuration do not change during runtime. Serialize
+    # them once here instead of re-encoding the same payload on every request.
+    graphBody = dumpb(serialize_elk_graph(being))
+    configBody = dumpb(CONFIG)
+
     @routes.get('/graph')
     async def get_graph(request):
-        elkGraph = serialize_elk_graph(being)
-        return json_response(elkGraph)
+        return web.Response(body=graphBody, content_type='application/json')
 
     @routes.get('/config')
     async def config(request):
-        return json_response(CONFIG)
+        return web.Response(body=configBody, content_type='application/json')
 
     return routes
 
@@ -346,19 +401,35 @@ def behavior_routes(behaviors) -> web.RouteTableDef:
         for behavior in behaviors
     }
 
+    # Serialized behavior payload cache for polling clients. Behaviors
+    # announce state / playback changes via BEHAVIOR_CHANGED; params updates
+    # get invalidated explicitly in receive_behavior_params below.
+    cachedBodies: Dict[int, bytes] = {}
+    for behavior in behaviors:
+        behavior.subscribe(BEHAVIOR_CHANGED, functools.partial(cachedBodies.pop, behavior.id, None))
+
+    def behavior_not_found(id) -> web.HTTPBadRequest:
+        return web.HTTPBadRequest(text=f'Behavior with id {id} does not exist!')
+
+    def behavior_body(behavior) -> bytes:
+        body = cachedBodies.get(behavior.id)
+        if body is None:
+            body = cachedBodies[behavior.id] = dumpb(behavior)
+
+        return body
+
     @routes.get('/behaviors/{id}')
     async def load_behavior(request):
         id = int(request.match_info['id'])
         try:
-            return json_response(behaviorLookup[id])
+            body = behavior_body(behaviorLookup[id])
+            return web.Response(body=body, content_type='application/json')
         except (ValueError, KeyError):
-            msg = f'Behavior with id {id} does not exist!'
-            return web.HTTPBadRequest(text=msg)
+            return behavior_not_found(id)
 
     @routes.get('/behaviors/{id}/states')
     async def load_behavior_states(request):
-        stateNames = list(BehaviorState.__members__)
-        return json_response(stateNames)
+        return web.Response(body=BEHAVIOR_STATES_BODY, content_type='application/json')
 
     @routes.put('/behaviors/{id}/toggle_playback')
     async def toggle_behavior_playback(request):
@@ -371,25 +442,24 @@ def behavior_routes(behaviors) -> web.RouteTableDef:
                 behavior.play()
                 behavior.update()  # Do one cycle so that we see which motion was last played
 
-            return json_response(behavior)
+            return web.Response(body=behavior_body(behavior), content_type='application/json')
         except (ValueError, KeyError):
-            msg = f'Behavior with id {id} does not exist!'
-            return web.HTTPBadRequest(text=msg)
+            return behavior_not_found(id)
 
     @routes.put('/behaviors/{id}/params')
     async def receive_behavior_params(request):
         id = int(request.match_info['id'])
         try:
-            params = await request.json()
+            params = json.loads(await request.read())
             behavior = behaviorLookup[id]
             behavior.params = params
-            return json_response(behavior)
+            cachedBodies.pop(behavior.id, None)
+            return web.Response(body=behavior_body(behavior), content_type='application/json')
         except json.JSONDecodeError:
             msg = f'Failed deserializing JSON behavior params!'
             return web.HTTPNotAcceptable(text=msg)
         except (ValueError, IndexError):
-            msg = f'Behavior with id {id} does not exist!'
-            return web.HTTPBadRequest(text=msg)
+            return behavior_not_found(id)
 
     return routes
 
@@ -408,6 +478,9 @@ def motion_player_routes(motionPlayers, behaviors) -> web.RouteTableDef:
     routes = web.RouteTableDef()
     mpLookup = { mp.id: mp for mp in motionPlayers }
 
+    def motion_player_not_found(id) -> web.HTTPBadRequest:
+        return web.HTTPBadRequest(text=f'Motion player with id {id} does not exist!')
+
     @routes.get('/motionPlayers')
     async def get_motion_players(request):
         """Inform front end of available motion players / motors."""
@@ -420,7 +493,7 @@ def motion_player_routes(motionPlayers, behaviors) -> web.RouteTableDef:
             behavior.pause()
 
         try:
-            dct = await request.json(loads=loads)
+            dct = loads(await request.read())
             startTimes = []
             for idStr, curve in dct['armed'].items():
                 id = int(idStr)  # JSON object keys become strings
@@ -433,7 +506,7 @@ def motion_player_routes(motionPlayers, behaviors) -> web.RouteTableDef:
 
             return json_response({'startTime': min(startTimes)})
         except IndexError:
-            return web.HTTPBadRequest(text=f'Motion player with id {id} does not exist!')
+            return motion_player_not_found(id)
         except KeyError:
             return web.HTTPBadRequest(text='Invalid request!')
         except ValueError as err:
@@ -450,7 +523,7 @@ def motion_player_routes(motionPlayers, behaviors) -> web.RouteTableDef:
             mp.stop()
             return respond_ok()
         except IndexError:
-            return web.HTTPBadRequest(text=f'Motion player with id {id} does not exist!')
+            return motion_player_not_found(id)
 
     @routes.post('/motionPlayers/stop')
     async def stop_all_spline_playbacks(request):
@@ -460,6 +533,10 @@ def motion_player_routes(motionPlayers, behaviors) -> web.RouteTableDef:
 
         return respond_ok()
 
+    # Most frequent endpoint while scrubbing in the UI. Local binding skips
+    # the math module attribute lookup per request.
+    isfinite = math.isfinite
+
     @routes.put('/motionPlayers/{id}/channels/{channel}/livePreview')
     async def live_preview(request):
         """Live preview of position value for motor."""
@@ -473,9 +550,9 @@ def motion_player_routes(motionPlayers, behaviors) -> web.RouteTableDef:
             if mp.playing:
                 mp.stop()
 
-            data = await request.json()
+            data = json.loads(await request.read())
             position = data.get('position')
-            if position is None or not math.isfinite(position):
+            if not isinstance(position, (int, float)) or not isfinite(position):
                 return web.HTTPBadRequest(text=f'Invalid value {position} for live preview!')
 
             mp.positionOutputs[channel].value = position
@@ -485,6 +562,42 @@ def motion_player_routes(motionPlayers, behaviors) -> web.RouteTableDef:
         except KeyError:
             return web.HTTPBadRequest(text='Could not parse spline!')
 
+    @routes.put('/motionPlayers/livePreview')
+    async def live_preview_batch(request):
+        """Batched live preview. Sets multiple channel positions across motion
+        players with a single request instead of one request per channel per
+        update tick. Expected payload format:
+
+        .. code-block:: json
+
+            {"positions": {"<motion player id>": {"<channel>": 1.234}}}
+        """
+        # Resolve and validate the full batch before touching anything so that
+        # a bad entry can not leave a half-applied update behind.
+        updates = []
+        try:
+            data = json.loads(await request.read())
+            for idStr, channels in data['positions'].items():
+                mp = mpLookup[int(idStr)]
+                for channelStr, position in channels.items():
+                    if not isinstance(position, (int, float)) or not isfinite(position):
+                        return web.HTTPBadRequest(text=f'Invalid value {position} for live preview!')
+
+                    updates.append((mp, mp.positionOutputs[int(channelStr)], position))
+        except (json.JSONDecodeError, KeyError, IndexError, TypeError, ValueError, AttributeError):
+            return web.HTTPBadRequest(text='Invalid request!')
+
+        for behavior in behaviors:
+            behavior.pause()
+
+        for mp, positionOutput, position in updates:
+            if mp.playing:
+                mp.stop()
+
+            positionOutput.value = position
+
+        return json_response()
+
     return routes
 
 
@@ -508,20 +621,40 @@ def motor_routes(being)  -> web.RouteTableDef:
         for mp in being.motionPlayers:
             mp.stop()
 
+    # Serialized motor listing cache. The payload only changes on motor state
+    # / homing transitions which every motor publishes anyway. Polling clients
+    # then get the cached bytes instead of a fresh serialization per request.
+    cachedBody = None
+
+    def invalidate_cached_body(*args):
+        nonlocal cachedBody
+        cachedBody = None
+
+    for motor in being.motors:
+        motor.subscribe(MotorEvent.STATE_CHANGED, invalidate_cached_body)
+        motor.subscribe(MotorEvent.HOMING_CHANGED, invalidate_cached_body)
+
+    def motors_body() -> bytes:
+        nonlocal cachedBody
+        if cachedBody is None:
+            cachedBody = dumpb(being.motors)
+
+        return cachedBody
+
     @routes.get('/motors')
     async def get_motors(request):
-        return json_response(being.motors)
+        return web.Response(body=motors_body(), content_type='application/json')
 
     @routes.put('/motors/disable')
     async def disable_motors(request):
         pause_others()
         being.disable_motors()
-        return json_response(being.motors)
+        return web.Response(body=motors_body(), content_type='application/json')
 
     @routes.put('/motors/enable')
     async def enable_motors(request):
         being.enable_motors()
-        return json_response(being.motors)
+        return web.Response(body=motors_body(), content_type='application/json')
 
     @routes.put('/motors/home')
     async def home_motors(request):
@@ -542,12 +675,16 @@ def misc_routes() -> web.RouteTableDef:
     async def convert_trajectory(request):
         """Convert a trajectory array to a spline."""
         try:
-            trajectory = await request.json()
-            data = np.array(trajectory)
-            t, *positionValues = data.T
+            trajectory = json.loads(await request.read())
+            # Single float conversion at the boundary. Everything downstream
+            # operates on array views instead of re-building arrays per column.
+            data = np.asarray(trajectory, dtype=float)
+            if data.ndim != TWO_D or data.shape[1] < 2:
+                raise ValueError
+
             splines = [
-                fit_spline(np.array([t, pos]).T, smoothing=1e-7)
-                for pos in positionValues
+                fit_spline(data[:, (0, col)], smoothing=1e-7)
+                for col in range(1, data.shape[1])
             ]
             curve = Curve(splines)
             return json_response(curve)
@@ -588,7 +725,7 @@ def params_routes(params) -> web.RouteTableDef:
 
     async def set_param(request, param):
         """Update value of parameter block."""
-        value = await request.json()
+        value = json.loads(await request.read())
         LOGGER.debug('set_param() %s %s', param, value)
         param.change(value)
         return json_response()
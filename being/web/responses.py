@@ -2,7 +2,7 @@
 from aiohttp import web
 from aiohttp.web_response import Response
 
-from being.serialization import dumps
+from being.serialization import dumpb
 
 
 def respond_ok() -> Response:
@@ -14,11 +14,15 @@ def respond_ok() -> Response:
     return web.Response()
 
 
-def json_response(obj=None) -> Response:
-    """aiohttp web.json_response but with our custom JSON serialization dumps.
+def json_response(obj=None, **kwargs) -> Response:
+    """aiohttp web.json_response but with our custom JSON serialization. Builds
+    the body directly as bytes (via :func:`being.serialization.dumpb`) which
+    skips the text serialize + UTF-8 encode round trip of
+    :func:`aiohttp.web.json_response`.
 
     Args:
         obj: Object to JSON serialize and pack in a response.
+        **kwargs: Arbitrary keyword arguments for :class:`aiohttp.web.Response`.
 
     Returns:
         Response with JSON payload.
@@ -26,7 +30,7 @@ def json_response(obj=None) -> Response:
     if obj is None:
         obj = {}
 
-    return web.json_response(obj, dumps=dumps)
+    return web.Response(body=dumpb(obj), content_type='application/json', **kwargs)
 
 
 # Note: Do not use lambda function as response factories! Leads to errors under Windows because the
@@ -208,12 +208,31 @@ def init_web_server(being: Being, ws: WebSocket) -> web.Application:
     staticDir = os.path.join(here, 'static')
     app.router.add_static(prefix='/static', path=staticDir, show_index=True)
 
+    async def add_static_cache_headers(request, response):
+        """Let clients revalidate static assets instead of re-downloading them
+        on every page load. FileResponse serves the bytes via sendfile and
+        honors conditional requests.
+        """
+        if request.path.startswith('/static') or request.path == '/favicon.ico':
+            response.headers.setdefault('Cache-Control', 'public, max-age=60')
+
+    app.on_response_prepare.append(add_static_cache_headers)
+
     # Routes
     routes = web.RouteTableDef()
 
+    # Stat favicon once; repeat requests with a matching ETag short-circuit to
+    # an empty 304 without touching the disk.
+    faviconPath = os.path.join(staticDir, 'favicon.ico')
+    faviconStat = os.stat(faviconPath)
+    faviconEtag = f'"{faviconStat.st_mtime_ns:x}-{faviconStat.st_size:x}"'
+
     @routes.get('/favicon.ico')
     async def get_favicon(request):
-        return web.FileResponse(os.path.join(staticDir, 'favicon.ico'))
+        if request.headers.get('If-None-Match') == faviconEtag:
+            return web.Response(status=304, headers={'ETag': faviconEtag})
+
+        return web.FileResponse(faviconPath, headers={'ETag': faviconEtag})
 
     @routes.get('/')
     @aiohttp_jinja2.template('index.html')
@@ -93,6 +93,9 @@ setup(
         # portaudio needs to be installed
         'audio':  ['PyAudio'],
 
+        # Faster JSON serialization / deserialization.
+        'fast':  ['orjson'],
+
         # Needed on Rpi for accessing GPIO.
         'rpi':  ['RPi.GPIO'],
     },
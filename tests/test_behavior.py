@@ -21,6 +21,9 @@ class DummyContent:
 
 
 class CallCounter:
+
+    __slots__ = ('func', 'nCalls')
+
     def __init__(self, func):
         self.func = func
         self.nCalls = 0
@@ -28,9 +31,9 @@ class CallCounter:
     def reset(self):
         self.nCalls = 0
 
-    def __call__(self, *args, **kwargs):
+    def __call__(self, state):
         self.nCalls += 1
-        return self.func(*args, **kwargs)
+        return self.func(state)
 
 
 class TestBehavior(unittest.TestCase):
@@ -157,6 +157,22 @@ class TestMessageConnections(unittest.TestCase):
         for dst in destinatons:
             self.assertEqual(list(dst.queue), messages)
 
+    def test_message_flow_follows_rewiring(self):
+        src = MessageOutput()
+        first = MessageInput()
+        second = MessageInput()
+
+        src.connect(first)
+        src.send('before')
+
+        # Same number of connections before and after the rewire
+        src.disconnect(first)
+        src.connect(second)
+        src.send('after')
+
+        self.assertEqual(list(first.queue), ['before'])
+        self.assertEqual(list(second.queue), ['after'])
+
     def test_receive(self):
         input_ = MessageInput()
         messages = list(range(10))
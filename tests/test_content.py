@@ -1,6 +1,117 @@
+import json
+import os
+import tempfile
 import unittest
 
-from being.content import Content
+from being.content import Content, Files
+
+
+class TestFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.files = Files(self.tmpDir.name, loads=json.loads, dumps=json.dumps)
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+    def test_iteration_is_alphabetical(self):
+        self.files['banana.json'] = 2
+        self.files['apple.json'] = 1
+        self.files['cherry.json'] = 3
+
+        self.assertEqual(list(self.files), ['apple.json', 'banana.json', 'cherry.json'])
+
+    def test_length_counts_files(self):
+        self.files['asdf.json'] = 1234
+
+        self.assertEqual(len(self.files), 1)
+
+    def test_hidden_files_are_skipped(self):
+        self.files['.hidden.json'] = 1234
+        self.files['visible.json'] = 1234
+
+        self.assertEqual(list(self.files), ['visible.json'])
+
+    def test_round_trip(self):
+        self.files['asdf.json'] = {'some': 'data'}
+
+        self.assertEqual(self.files['asdf.json'], {'some': 'data'})
+
+    def test_load_all_preserves_alphabetical_order(self):
+        self.files['banana.json'] = 2
+        self.files['apple.json'] = 1
+        self.files['cherry.json'] = 3
+
+        self.assertEqual(self.files.load_all(), [
+            ('apple.json', 1),
+            ('banana.json', 2),
+            ('cherry.json', 3),
+        ])
+
+    def test_load_all_serves_cached_objects(self):
+        obj = {'some': 'data'}
+        self.files['asdf.json'] = obj
+
+        self.assertIs(self.files.load_all()[0][1], obj)
+        self.assertIs(self.files.load_all()[0][1], obj)
+
+    def test_load_all_with_empty_directory(self):
+        self.assertEqual(self.files.load_all(), [])
+
+    def test_unchanged_file_is_served_from_cache(self):
+        self.files['asdf.json'] = {'some': 'data'}
+
+        first = self.files['asdf.json']
+        second = self.files['asdf.json']
+
+        self.assertIs(first, second)
+
+    def test_saved_object_is_served_without_reload(self):
+        obj = {'some': 'data'}
+        self.files['asdf.json'] = obj
+
+        self.assertIs(self.files['asdf.json'], obj)
+
+    def test_write_raw_stores_data_and_caches_object(self):
+        obj = {'some': 'data'}
+        self.files.write_raw('asdf.json', b'{"some": "data"}', obj)
+
+        fp = os.path.join(self.tmpDir.name, 'asdf.json')
+        with open(fp, 'rb') as f:
+            self.assertEqual(f.read(), b'{"some": "data"}')
+
+        self.assertIs(self.files['asdf.json'], obj)
+
+    def test_modified_file_is_reloaded(self):
+        self.files['asdf.json'] = {'some': 'data'}
+        first = self.files['asdf.json']
+
+        fp = os.path.join(self.tmpDir.name, 'asdf.json')
+        with open(fp, 'w') as f:
+            json.dump({'other': 'data'}, f)
+
+        os.utime(fp, ns=(0, 0))  # Force distinct mtime
+
+        self.assertEqual(self.files['asdf.json'], {'other': 'data'})
+
+    def test_renaming_moves_file_on_disk(self):
+        self.files['asdf.json'] = {'some': 'data'}
+        self.files.rename('asdf.json', 'qwer.json')
+
+        self.assertEqual(list(self.files), ['qwer.json'])
+        self.assertEqual(self.files['qwer.json'], {'some': 'data'})
+
+    def test_renaming_non_existing_file_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self.files.rename('asdf.json', 'qwer.json')
+
+    def test_deleted_file_is_evicted_from_cache(self):
+        self.files['asdf.json'] = {'some': 'data'}
+        self.files['asdf.json']
+        del self.files['asdf.json']
+
+        with self.assertRaises(FileNotFoundError):
+            self.files['asdf.json']
 
 
 class TestContent(unittest.TestCase):
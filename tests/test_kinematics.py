@@ -2,7 +2,13 @@ import unittest
 
 from numpy.testing import assert_allclose
 
-from being.kinematics import State, optimal_trajectory as _optimal_trajectory, step
+from being.kinematics import (
+    State,
+    kinematic_filter,
+    make_kinematic_filter,
+    optimal_trajectory as _optimal_trajectory,
+    step,
+)
 
 
 def optimal_trajectory(*args, **kwargs):
@@ -168,5 +174,20 @@ class TestOptimalTrajectory(unittest.TestCase):
         self.assertEqual(final_state(initial, profiles), target)
 
 
+class TestMakeKinematicFilter(unittest.TestCase):
+    def test_specialized_filter_matches_generic_kinematic_filter(self):
+        dt = 0.1
+        kwargs = dict(maxSpeed=1., maxAcc=1., lower=0., upper=.5)
+        specialized = make_kinematic_filter(dt, **kwargs)
+
+        generic = State()
+        special = State()
+        for target in [0., .2, 1., -3., .456, .456, 0.]:
+            generic = kinematic_filter(target, dt, initial=generic, **kwargs)
+            special = specialized(target, special)
+
+            assert_allclose(special, generic)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+
+import numpy as np
+
+from being.math import (
+    ArchimedeanSpiral,
+    clip,
+    linear_mapping,
+    sign,
+    solve_quadratic_equation,
+    solve_quadratic_equation_vec,
+)
+
+
+class TestClip(unittest.TestCase):
+    def test_scalar_clipping(self):
+        self.assertEqual(clip(-1., 0., 10.), 0.)
+        self.assertEqual(clip(5., 0., 10.), 5.)
+        self.assertEqual(clip(11., 0., 10.), 10.)
+
+    def test_swapped_bounds(self):
+        self.assertEqual(clip(11., 10., 0.), 10.)
+
+    def test_array_clipping(self):
+        arr = np.array([-1., 5., 11.])
+
+        np.testing.assert_array_equal(clip(arr, 0., 10.), [0., 5., 10.])
+
+
+class TestLinearMapping(unittest.TestCase):
+    def test_identity(self):
+        np.testing.assert_allclose(linear_mapping((0., 1.), (0., 1.)), [1., 0.])
+
+    def test_scale_and_offset(self):
+        a, b = linear_mapping((0., 10.), (-1., 1.))
+
+        self.assertAlmostEqual(a * 0. + b, -1.)
+        self.assertAlmostEqual(a * 10. + b, 1.)
+
+    def test_returns_ndarray(self):
+        self.assertIsInstance(linear_mapping((0., 1.), (2., 3.)), np.ndarray)
+
+
+class TestSign(unittest.TestCase):
+    def test_scalar_sign(self):
+        self.assertEqual(sign(-12.34), -1.)
+        self.assertEqual(sign(12.34), 1.)
+
+    def test_array_sign(self):
+        arr = np.array([-2., 0., 3.])
+
+        np.testing.assert_array_equal(sign(arr), [-1., 0., 1.])
+
+
+class TestSolveQuadraticEquation(unittest.TestCase):
+    def test_simple_roots(self):
+        x0, x1 = solve_quadratic_equation(1., 0., -4.)
+
+        self.assertAlmostEqual(x0, 2.)
+        self.assertAlmostEqual(x1, -2.)
+
+    def test_vectorized_solutions_match_scalar_version(self):
+        a = np.array([1., 2., 1.])
+        b = np.array([0., -3., 5.])
+        c = np.array([-4., 1., 4.])
+
+        x0, x1 = solve_quadratic_equation_vec(a, b, c)
+
+        for i in range(len(a)):
+            expected = sorted(solve_quadratic_equation(a[i], b[i], c[i]))
+            self.assertAlmostEqual(sorted([x0[i], x1[i]])[0], expected[0])
+            self.assertAlmostEqual(sorted([x0[i], x1[i]])[1], expected[1])
+
+    def test_vectorized_version_is_numerically_stable(self):
+        # Roots of (x - 1e-8)(x - 1e8) where the naive formula suffers from
+        # catastrophic cancellation for the small root.
+        x0, x1 = solve_quadratic_equation_vec(1., -1e8 - 1e-8, 1.)
+        small, large = sorted([float(x0), float(x1)])
+
+        self.assertAlmostEqual(small, 1e-8)
+        self.assertAlmostEqual(large, 1e8)
+
+
+class TestArchimedeanSpiral(unittest.TestCase):
+    def test_circle_case(self):
+        spiral, phiEst = ArchimedeanSpiral.fit(diameter=1., outerDiameter=1., arcLength=10.)
+
+        self.assertEqual(spiral.b, 0.)
+        self.assertAlmostEqual(phiEst, 10. / .5)
+
+    def test_fitted_spiral_satisfies_both_conditions(self):
+        diameter = 0.02
+        outerDiameter = 0.04
+        arcLength = 1.
+
+        spiral, phiEst = ArchimedeanSpiral.fit(diameter, outerDiameter, arcLength)
+
+        self.assertAlmostEqual(spiral.radius(phiEst), .5 * outerDiameter)
+        self.assertAlmostEqual(spiral.arc_length(phiEst), arcLength)
+
+    def test_arc_length_accepts_angle_arrays(self):
+        spiral = ArchimedeanSpiral(a=.01, b=.001)
+        angles = np.linspace(0., 10., 5)
+
+        lengths = spiral.arc_length(angles)
+
+        np.testing.assert_allclose(lengths, [spiral.arc_length(phi) for phi in angles])
+
+    def test_outer_diameter_has_to_be_larger(self):
+        with self.assertRaises(ValueError):
+            ArchimedeanSpiral.fit(diameter=1., outerDiameter=.5, arcLength=10.)
+
+
+if __name__ == '__main__':
+    unittest.main()
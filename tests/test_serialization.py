@@ -7,9 +7,10 @@ from numpy.testing import assert_equal
 from scipy.interpolate import PPoly, CubicSpline, BPoly
 
 from being.serialization import (
-    ENUM_LOOKUP, EOT, NAMED_TUPLE_LOOKUP, FlyByDecoder, dumps, enum_from_dict,
-    enum_to_dict, loads, named_tuple_as_dict, named_tuple_from_dict,
-    register_enum, register_named_tuple, _enum_type_qualname,
+    ENUM_LOOKUP, EOT, NAMED_TUPLE_LOOKUP, FlyByDecoder, dumpb, dumps,
+    enum_from_dict, enum_to_dict, loads, named_tuple_as_dict,
+    named_tuple_from_dict, register_enum, register_named_tuple,
+    _enum_type_qualname,
 )
 
 
@@ -48,6 +49,13 @@ class TestSerialization(unittest.TestCase):
             arrCpy = loads(dumps(arr))
             assert_equal(arrCpy, arr)
 
+    def test_non_str_dict_keys_get_coerced(self):
+        # E.g. the /blocks endpoint serializes {block.id: block} with int ids
+        dct = {0: 'first', 1: 'second'}
+
+        self.assertEqual(loads(dumps(dct)), {'0': 'first', '1': 'second'})
+        self.assertEqual(loads(dumpb(dct)), {'0': 'first', '1': 'second'})
+
     def test_with_new_named_tuple(self):
         Foo = NamedTuple('Foo', name=str, id=int)
         foo = Foo('Calimero', 42)
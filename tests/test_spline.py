@@ -10,6 +10,7 @@ from being.spline import (
     copy_spline,
     sample_spline,
     ppoly_coefficients_at,
+    power_basis_segments,
     ppoly_insert,
     smoothing_spline,
     spline_coefficients,
@@ -74,6 +75,18 @@ class TestHelpers(unittest.TestCase):
         assert_equal(ppoly_coefficients_at(spline, 1.0), spline_coefficients(spline, 1))
         assert_equal(ppoly_coefficients_at(spline, 3.0), spline_coefficients(spline, 2))
 
+    def test_power_basis_segments_match_spline_evaluation(self):
+        spline = build_ppoly([1, 0, -1], [0.0, 1.0, 3.0, 4.0])
+        for s in [spline, BPoly.from_power_basis(spline)]:
+            segments = power_basis_segments(s)
+            for start, end, coefficients in segments:
+                for t in np.linspace(start, end, 5, endpoint=False):
+                    horner = 0.0
+                    for c in reversed(coefficients):
+                        horner = horner * (t - start) + c
+
+                    self.assertAlmostEqual(horner, spline(t))
+
 
 class TestPPolyKnotInsertion(unittest.TestCase):
     def assert_splines_equal(self, a, b):
@@ -104,6 +104,12 @@ class TestNestedDict(unittest.TestCase):
         self.assertEqual(nested.get(keys, default), default)
         self.assertEqual(nested.data, dataCopy)
 
+    def test_get_with_bad_path_into_leaf_returns_default(self):
+        nested = NestedDict({'this': {'is': [10, 20]}})
+
+        self.assertEqual(nested.get(('this', 'is', 5)), None)
+        self.assertEqual(nested.get(('this', 'is', 0, 'deeper')), None)
+
     """
     def test_setting_item_can_lead_to_keyerrors(self):
         d = NestedDict()